@@ -546,7 +546,7 @@ class PgPlayer(Player):
             self.post_event(pygame.event.Event(pygame.USEREVENT, subtype="points", msg=msg), 2)
         elif notification.type in [NotificationType.POINTS, NotificationType.SCORE_HAND, NotificationType.SCORE_CRIB]:
             msg = ("You " if notification.player == self else "Opponent") + " scored +" + str(notification.points) + ": " + notification.data
-            subtype = str(notification.type).lower().replace("notificationtype.", "")
+            subtype = notification.type.name.lower()
             if subtype == "points":
                 self.post_event(pygame.event.Event(pygame.USEREVENT, subtype=subtype, player=notification.player, msg=msg), 2)
             else:
@@ -636,15 +636,19 @@ class PgPlayer(Player):
         return comment
 
 
-# Change to the same directory as Cribbage.py so paths to other files work
-if len(argv) >= 1:
-    dir = path.dirname(argv[0])
-    if len(dir) > 0:
-      if not path.isabs(dir):
-          cwd = getcwd()
-          dir = cwd + path.sep + dir
-      chdir(dir)
+def main():
+    # Change to the same directory as Cribbage.py so paths to other files work
+    if len(argv) >= 1:
+        dir = path.dirname(argv[0])
+        if len(dir) > 0:
+          if not path.isabs(dir):
+              cwd = getcwd()
+              dir = cwd + path.sep + dir
+          chdir(dir)
 
-# Play the game
-player = PgPlayer()
-player.play()
\ No newline at end of file
+    # Play the game
+    player = PgPlayer()
+    player.play()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -25,20 +25,24 @@ Game play itself it a state machine (unfortunately not implemented in a structur
 """
 
 from abc import abstractmethod
-from enum import IntEnum, Enum, auto
+from enum import IntEnum
 from typing import List, Tuple, Final
-from math import comb
+from functools import lru_cache
 from time import time
+from sys import intern
+from collections import deque
 import random
 
-# A suit
-class Suit(IntEnum):
-    CLUBS = 0
-    DIAMODS = 1
-    HEARTS = 2
-    SPADES = 3
+# A suit - suits are plain ints, as IntEnum members are much slower to compare and hash
+class Suit:
+    CLUBS : Final = 0
+    DIAMONDS : Final = 1
+    HEARTS : Final = 2
+    SPADES : Final = 3
+    DIAMODS : Final = DIAMONDS  # The old (misspelled) name, kept for existing callers
 
 # A Card
+# Each card also has an int code, rank major (code = (rank - 1)*4 + suit), so comparing codes sorts by rank then suit
 class Card:
     _SUIT_NAMES:Final = ["clubs", "diamonds", "hearts", "spades"]
     _RANK_NAMES:Final = ["ace", "2", "3", "4", "5", "6", "7", "8", "9", "10", "jack", "queen", "king"]
@@ -49,12 +53,15 @@ class Card:
         self._rank = rank
         if rank < 1 or rank > 13:
             raise ValueError("Invalid rank - must be between 1 and 13")
+        self._code = (rank - 1) * 4 + suit
+        self._suit_code = suit * 13 + rank - 1     # Like _code, but suit major (for sorting suit first)
+        self._points = rank if rank < 10 else 10
+        self._str = intern(Card._RANK_NAMES[rank - 1] + " of " + Card._SUIT_NAMES[suit])
 
     def __lt__ (self, other):
         if Card.sortRankFirst:
-            return self.rank < other.rank or (self.rank == other.rank and self.suit < other.suit)
-        else:
-            return self.suit < other.suit or (self.suit == other.suit and self.rank < other.rank)
+            return self._code < other._code
+        return self._suit_code < other._suit_code
 
     @property
     def suit(self) -> Suit:
@@ -66,29 +73,48 @@ class Card:
 
     @property
     def points(self) -> int:
-        return self._rank if self._rank < 10 else 10
+        return self._points
 
     def __str__(self):
-        return Card._RANK_NAMES[self._rank - 1] + " of " + Card._SUIT_NAMES[self._suit]
+        return self._str
+
+_CARDS:Final = tuple(Card(code % 4, code // 4 + 1) for code in range(52))
+_CODES_BY_NAME:Final = {str(card) : card._code for card in _CARDS}
+
+# The code of a card, given either the card or its name
+def _card_code(card_or_card_name) -> int:
+    if isinstance(card_or_card_name, Card):
+        return card_or_card_name._code
+    return _CODES_BY_NAME.get(card_or_card_name)
     
-# A Deck of 52 cards
+# A set of cards can be represented as a bitmask, where bit n is set for the card with code n
+# These are the masks of all the cards in each suit
+_SUIT_MASKS:Final = tuple(sum(1 << code for code in range(suit, 52, 4)) for suit in range(4))
+
+def cards_mask(cards) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card._code
+    return mask
+
+# The codes of an unshuffled deck, in suit then rank order
+_MASTER_DECK:Final = tuple((rank - 1) * 4 + suit for suit in range(4) for rank in range (1, 14))
+
+# The cards are kept as codes in a deque so drawing from the top is O(1)
 class Deck:
     def __init__ (self):
-        self._cards = []
-        for suit in [Suit.CLUBS, Suit.DIAMODS, Suit.HEARTS, Suit.SPADES]:
-            for rank in range (1, 14):
-                self._cards.append (Card(suit, rank))
-    
+        self._cards = deque(_MASTER_DECK)
+
+    # Shuffle as a list (random access into a deque is O(n)), then put the cards back
     def shuffle(self) -> None:
-        random.shuffle(self._cards)
+        cards = list(self._cards)
+        random.shuffle(cards)
+        self._cards.clear()
+        self._cards.extend(cards)
 
     def draw(self) -> Card:
-        return self._cards.pop(0)
+        return _CARDS[self._cards.popleft()]
 
-    def cut_a_card(self) -> Card:
-        return self._cards[random.randint(0, len(self._cards)) - 1]
-    
-    @property
     def __len__(self) -> int:
         return len(self._cards)
 
@@ -96,42 +122,74 @@ class Deck:
 Hand - a hand of cards (subset of the deck)
 """
 class Hand:
+    __slots__ = ("_cards", "_played_cards", "_by_code", "_min_points")
+
     def __init__ (self):
         self._cards = []
         self._played_cards = []
+        self._by_code = {}          # Unplayed cards by card code, so cards can be found without a linear scan
+        self._min_points = None     # Lowest point value of the unplayed cards, cached (None if it needs recomputing)
 
     def add_card(self, card : Card) -> None:
+        self._by_code[card._code] = card
+        self._min_points = None
         return self._cards.append(card)
 
+    # Add several cards at once (e.g, a deal or a player's lay-aways)
+    def add_cards(self, cards : List[Card]) -> None:
+        for card in cards:
+            self._by_code[card._code] = card
+        self._min_points = None
+        self._cards.extend(cards)
+
     def find_card(self, card_or_card_name) -> Card:
-        for i in range(len(self._cards)):
-            if str(self._cards[i]) == str(card_or_card_name):
-                return self._cards[i]
-        return None
+        return self._by_code.get(_card_code(card_or_card_name))
 
     def play_card(self, card_or_card_name, to_crib : bool = False) -> Card:
-        for i in range(len(self._cards)):
-            if str(self._cards[i]) == str(card_or_card_name):
-                card = self._cards.pop(i)
-                if not to_crib:
-                    self._played_cards.append(card)
-                return card
-        return None
+        card = self._by_code.pop(_card_code(card_or_card_name), None)
+        if card is None:
+            return None
+        self._cards.remove(card)
+        self._min_points = None
+        if not to_crib:
+            self._played_cards.append(card)
+        return card
+
+    # Move all the remaining cards to the played cards, in order
+    def play_all_cards(self) -> None:
+        self._played_cards.extend(self._cards)
+        self._cards.clear()
+        self._by_code.clear()
+        self._min_points = None
 
     def push (self, index : int, card : Card) -> None:
+        self._by_code[card._code] = card
+        self._min_points = None
         self._cards.insert (index, card)
     
     def pop (self, index : int) -> Card:
-        return self._cards.pop(index)
+        card = self._cards.pop(index)
+        del self._by_code[card._code]
+        self._min_points = None
+        return card
 
     def sort(self) -> None:
         self._cards.sort()
 
+    # Empty the hand (played cards too) so it can be reused for the next deal
+    def clear(self) -> None:
+        self._cards.clear()
+        self._played_cards.clear()
+        self._by_code.clear()
+        self._min_points = None
+
     def reset(self) -> None:
         assert len(self._cards) == 0, "Reseting hand only happens at end of round when hand is empty"
         self._cards = self._played_cards
         self._played_cards = []
         self._cards.sort()
+        self._by_code = {card._code : card for card in self._cards}
+        self._min_points = None
 
     def __getitem__(self, key) -> Card:
         return self._cards[key]
@@ -143,10 +201,14 @@ class Hand:
         return len(self._cards)
 
     def __str__(self):
-        s = ""
-        for card in self._cards:
-            s += str(card) + ", "
-        return s.rstrip(", ")
+        return ", ".join(map(str, self._cards))
+
+    # The lowest point value of the unplayed cards (99 if there are none), to tell if the hand can play on a pile
+    @property
+    def min_points (self) -> int:
+        if self._min_points is None:
+            self._min_points = min((card._points for card in self._cards), default=99)
+        return self._min_points
 
     @property
     def played_cards (self):
@@ -156,27 +218,38 @@ class Hand:
 Discards - the cribbage discard pile(s)
 """
 class Discards:
+    __slots__ = ("_hand", "_ranks", "sum")
+
     def __init__(self):
         self._hand = Hand()
+        self._ranks = []        # Ranks of the cards on the current pile, for pegging scoring
         self.sum = 0
 
     # Add a card to the discard pile
     def add_card (self, card : Card) -> None:
-        points = card.points
+        points = card._points
         if points + self.sum > 31:
             raise ValueError ("Can't exceed 31 points on the discard pile")
         self._hand.add_card(card)
+        self._ranks.append(card._rank)
         self.sum += points
 
     # Pop the last added card (only used for algos)
     def pop (self) -> None:
-        card = self._hand.pop(len(self._hand) - 1)
-        self.sum -= card.points
+        card = self._hand.pop(-1)
+        self._ranks.pop()
+        self.sum -= card._points
+
+    # Empty both the current pile and the older discards, for a new round
+    def reset (self) -> None:
+        self._hand.clear()
+        self._ranks.clear()
+        self.sum = 0
 
     # Start a new pile by discarding all the cards on the current pile
     def start_new_pile (self) -> None:
-        while len(self._hand) > 0:
-            self._hand.play_card(str(self._hand[0]))
+        self._hand.play_all_cards()
+        self._ranks.clear()
         self.sum = 0
 
     def __len__(self):
@@ -186,12 +259,10 @@ class Discards:
         return self._hand[key]
 
     def __str__(self):
-        s = "Current discard pile (" + str(self.sum) + "): " + str(self._hand)
+        s = f"Current discard pile ({self.sum}): {self._hand}"
         if len(self.older_discards) > 0:
-            s += "\t\tOlder discards: "
-            for card in self.older_discards:
-                s += str(card) + " "
-        return s.rstrip()
+            s += "\t\tOlder discards: " + " ".join(map(str, self.older_discards))
+        return s
 
     @property
     def older_discards(self):
@@ -200,6 +271,9 @@ class Discards:
 Player - a cribbage player
 """
 class Player:
+    __slots__ = ("name", "hand", "score", "crib")   # Only saves the __dict__ for subclasses that declare __slots__ too
+    wants_notifications = True      # Players that ignore notify() can set this False, so games between them skip building any
+
     def __init__ (self):
         self.name = ""
         self.reset()
@@ -227,10 +301,16 @@ Includes method to set/rotate dealers, and set/rotate whose turn it is to play w
 The first turn after the deal is the player right after the dealer
 """
 class Players:
+    __slots__ = ("_players", "_num_players", "_index", "_next", "_whose_deal", "_whose_turn")
+
     def __init__ (self, players : List[Player]):
         if len(players) < 2:
             raise ValueError ("players list must have at least 2 elements")
         self._players = players
+        num_players = len(players)
+        self._num_players = num_players
+        self._index = {id(player) : i for i, player in enumerate(players)}     # Player positions by identity
+        self._next = tuple((i + 1) % num_players for i in range(num_players))   # Position of the player to the left
         self.set_dealer(players[0])
 
     @property
@@ -242,41 +322,36 @@ class Players:
         return self._players[self._whose_turn]
 
     def rotate_turn(self) -> None:
-        self._whose_turn += 1
-        self._whose_turn %= len(self._players)
+        self._whose_turn = self._next[self._whose_turn]
     
     def rotate_dealer(self) -> None:
-        self._whose_deal += 1
-        self._whose_deal %= len(self._players)
-        self._whose_turn = self._whose_deal + 1
-        self._whose_turn %= len(self._players)
+        next_seat = self._next
+        whose_deal = next_seat[self._whose_deal]
+        self._whose_deal = whose_deal
+        self._whose_turn = next_seat[whose_deal]
 
     def set_dealer(self, player : Player) -> None:
-        for i in range (len(self._players)):
-            if self._players[i] == player:
-                self._whose_deal = i
-                self._whose_turn = (self._whose_deal + 1) % len(self._players)
-                return
-        raise ValueError("Player not found")
+        i = self._index.get(id(player))
+        if i is None:
+            raise ValueError("Player not found")
+        self._whose_deal = i
+        self._whose_turn = self._next[i]
 
     def next_player (self, player : Player) -> Player:
-        for i in range (len(self._players)):
-            if self._players[i] == player:
-                return self._players[(i + 1) % len(self._players)]
-        raise ValueError("Player not found")
+        i = self._index.get(id(player))
+        if i is None:
+            raise ValueError("Player not found")
+        return self._players[self._next[i]]
 
     def reset (self) -> None:
         for player in self._players:
             player.reset()
 
     def __len__ (self):
-        return len(self._players)
+        return self._num_players
     
     def __str__(self):
-        s = ""
-        for player in self._players:
-            s += player.name + ", "
-        return s.rstrip(", ")
+        return ", ".join(player.name for player in self._players)
 
     def __iter__(self):
         return self._players.__iter__()
@@ -286,20 +361,23 @@ class Players:
 
 
 # Type of notification; each type carries different data
-class NotificationType(Enum):
-    NEW_GAME     = auto()   # Start of a new game
-    CUT_FOR_DEAL = auto()   # A player cut for deal
-    DEAL         = auto()   # The dealer dealt the hands
-    STARTER_CARD = auto()   # Starter card selected
-    PLAY         = auto()   # A pegging card was played
-    GO           = auto()   # Player said "go"
-    SCORE_HAND   = auto()   # A hand was scored
-    SCORE_CRIB   = auto()   # The crib was scored
-    POINTS       = auto()   # Points were scored
-    ROUND_OVER   = auto()   # A round has ended
-    GAME_OVER    = auto()   # The game has ended
+# An IntEnum numbered from 0, so the types compare as ints and can index the table of notification formats
+class NotificationType(IntEnum):
+    NEW_GAME     = 0        # Start of a new game
+    CUT_FOR_DEAL = 1        # A player cut for deal
+    DEAL         = 2        # The dealer dealt the hands
+    STARTER_CARD = 3        # Starter card selected
+    PLAY         = 4        # A pegging card was played
+    GO           = 5        # Player said "go"
+    SCORE_HAND   = 6        # A hand was scored
+    SCORE_CRIB   = 7        # The crib was scored
+    POINTS       = 8        # Points were scored
+    ROUND_OVER   = 9        # A round has ended
+    GAME_OVER    = 10       # The game has ended
 
 class Notification:
+    __slots__ = ("type", "player", "points", "data")   # One is created per game event, so skip the per-instance __dict__
+
     def __init__(self, type: NotificationType, player : Player, points : int, data : str = None):
         self.type = type
         self.player = player
@@ -307,87 +385,160 @@ class Notification:
         self.data = data
 
     def __str__(self):
-        if self.type == NotificationType.NEW_GAME:
-            return "A new game has started between " + self.data
-        if self.type == NotificationType.CUT_FOR_DEAL:
-            return self.player.name + " cut the " + str(self.data)
-        elif self.type == NotificationType.DEAL:
-            return "\n" + self.player.name + " dealt the cards and will have the crib"
-        elif self.type == NotificationType.STARTER_CARD:
-            return self.player.name + " cut the starter card " + self.data
-        elif self.type == NotificationType.PLAY:
-            return self.player.name + " played the " + self.data
-        elif self.type == NotificationType.GO:
-            return self.player.name + " said 'go'"
-        elif self.type == NotificationType.POINTS:
-            return self.player.name + ": " + self.data + " for " + str(self.points) + " (score = " + str(self.player.score) + ")"
-        elif self.type == NotificationType.SCORE_HAND:
-            return self.player.name + " hand scored " + str(self.points) + " (total score is now " + str(self.player.score) + ")\n" + self.data
-        elif self.type == NotificationType.SCORE_CRIB:
-            return self.player.name + " crib scored " + str(self.points) + " (total score is now " + str(self.player.score) + ")\n" + self.data
-        elif self.type == NotificationType.ROUND_OVER:
-            return "\nThe round has ended, it's time to cound the hands and the crib, with starter card " + self.data
-        elif self.type == NotificationType.GAME_OVER:
-            return "The game has ended, " + self.player.name + " won!\nFinal score: " + self.data
-        else:
-            return str(self.type) + " - " + self.player.name + ": " + self.data + " (+" + str(self.points) + " points)"
+        return _NOTIFICATION_FORMATS[self.type](self)
+
+# How to describe each type of notification (every NotificationType must have an entry)
+_FORMATS_BY_TYPE = {
+    NotificationType.NEW_GAME     : lambda n: f"A new game has started between {n.data}",
+    NotificationType.CUT_FOR_DEAL : lambda n: f"{n.player.name} cut the {n.data}",
+    NotificationType.DEAL         : lambda n: f"\n{n.player.name} dealt the cards and will have the crib",
+    NotificationType.STARTER_CARD : lambda n: f"{n.player.name} cut the starter card {n.data}",
+    NotificationType.PLAY         : lambda n: f"{n.player.name} played the {n.data}",
+    NotificationType.GO           : lambda n: f"{n.player.name} said 'go'",
+    NotificationType.POINTS       : lambda n: f"{n.player.name}: {n.data} for {n.points} (score = {n.player.score})",
+    NotificationType.SCORE_HAND   : lambda n: f"{n.player.name} hand scored {n.points} (total score is now {n.player.score})\n{n.data}",
+    NotificationType.SCORE_CRIB   : lambda n: f"{n.player.name} crib scored {n.points} (total score is now {n.player.score})\n{n.data}",
+    NotificationType.ROUND_OVER   : lambda n: f"\nThe round has ended, it's time to cound the hands and the crib, with starter card {n.data}",
+    NotificationType.GAME_OVER    : lambda n: f"The game has ended, {n.player.name} won!\nFinal score: {n.data}",
+}
+assert len(_FORMATS_BY_TYPE) == len(NotificationType), "Missing a notification format"
+_NOTIFICATION_FORMATS:Final = [_FORMATS_BY_TYPE[notification_type] for notification_type in NotificationType]   # By type value
+
+# Score the 15s, pairs and runs in a list of card ranks - the part of a hand's value that doesn't depend on suits
+# The AI players call this for every lay-away/starter combination, so results are cached by the sorted ranks
+# (there are under 9000 distinct hands of up to 5 ranks)
+def score_ranks(ranks : List[int]) -> int:
+    return _score_sorted_ranks(tuple(sorted(ranks)))
+
+# Count the ways to make 15 from a list of card ranks, using the sums of all 2^n subsets of their point values
+# Each card doubles the list of subset sums (the sums without it, plus the sums with it), so it's a flat loop over ints
+def count_fifteens(ranks : List[int]) -> int:
+    sums = [0]
+    for rank in ranks:
+        card_points = rank if rank < 10 else 10
+        sums += [s + card_points for s in sums]
+    return sums.count(15)
+
+# The cached kernel of score_ranks, given the ranks sorted
+# 15s, pairs and runs are counted by the same helpers get_hand_value uses (see Game.get_rank_scores)
+@lru_cache(maxsize=None)
+def _score_sorted_ranks(ranks : Tuple[int]) -> int:
+    counts = [0]*15
+    for rank in ranks:
+        counts[rank] += 1
+    run_len, multiplier = Game.get_run_count(counts)
+    return 2 * count_fifteens(ranks) + 2 * Game.get_pair_count(counts) + run_len * multiplier
+
+# Score the pegging points for the last card played onto a pile, given the ranks of the cards on the pile and its total
+# This is the numeric core of both pegging scoring and the AI's evaluation of candidate plays; it only uses ints
+# Returns a tuple of the points, the number of cards of the same rank in a row, and the run length (0 if no run)
+def peg_score(ranks : List[int], pile_sum : int) -> Tuple[int, int, int]:
+    points = 0
+    if pile_sum == 31 or pile_sum == 15:
+        points += 2
+
+    n = len(ranks)
+    rank = ranks[n - 1]
+    in_a_row = 1
+    i = n - 2
+    while i >= 0 and ranks[i] == rank:
+        in_a_row += 1
+        i -= 1
+    points += in_a_row * (in_a_row - 1)     # 2 points for each pair: 0, 2, 6 or 12
+
+    # Runs - walk back from the last card, tracking the ranks seen (as a bitmask) and their range
+    # The last k cards are a run if they are k distinct ranks spanning exactly k values; a repeated rank ends the search
+    run_len = 0
+    seen = 0
+    lo = hi = rank
+    for k in range(1, n + 1):
+        r = ranks[n - k]
+        bit = 1 << r
+        if seen & bit:
+            break
+        seen |= bit
+        if r < lo:
+            lo = r
+        elif r > hi:
+            hi = r
+        if k >= 3 and hi - lo + 1 == k:
+            run_len = k
+    points += run_len
+
+    return points, in_a_row, run_len
 
 # Game - a nice game of cribbage
 class Game:
+    __slots__ = ("players", "starter", "discards", "crib", "initial_dealer", "last_to_peg",
+                 "_notifying", "_notify_fns", "_max_score", "_cards_left")
+
     def __init__(self, players : List[Players]):
         self.players = Players(players)
         self.starter = None
 
+        # The discard pile is reused rather than reallocated
+        self.discards = Discards()
+        self.crib = None
+
+        # Notifications are only built if some player wants them (AI only games don't)
+        # The players' notify methods are bound once, as there are many notifications per round
+        self._notifying = any(player.wants_notifications for player in players)
+        self._notify_fns = tuple(player.notify for player in players)
+
+        # The highest score and the number of cards left to peg are kept up to date, so game_over/round_over are cheap
+        self._max_score = 0
+        self._cards_left = 0
+
     # A helper method to notify all players when something happens
     def notify_all(self, notification : Notification) -> None:
-        for player in self.players:
-            player.notify (notification)
+        for notify in self._notify_fns:
+            notify (notification)
+
+    # Build a notification and send it to all players, unless no player wants notifications
+    def _notify(self, type : NotificationType, player : Player, points : int, data = None) -> None:
+        if self._notifying:
+            self.notify_all(Notification(type, player, points, data))
 
-        # Is the game over (someone scored 121)?
+    # Is the game over (someone scored 121)?
     @property
     def game_over(self) -> bool:
-        for player in self.players:
-            if player.score >= 121:
-                return True
-        return False
+        return self._max_score >= 121
 
     # Is the round over (either game over or all hands have been played)?
     @property
     def round_over(self):
-        if self.game_over:
-            return True
-        for player in self.players:
-            if len(player.hand) > 0:
-                return False
-        return True
+        return self._max_score >= 121 or self._cards_left == 0
 
     # Can anyone go? If not, we need to reset the discard pile
     @property
     def can_anyone_go(self) -> bool:
-        for player in self.players:
-            if len(player.hand) > 0 and player.hand[0].points + self.discards.sum <= 31:
-                return True
-        return False
+        points_left = 31 - self.discards.sum
+        return any(player.hand.min_points <= points_left for player in self.players)
 
     def add_points (self, player : Player, points : int, reason : str):
-        player.score += points
+        self._add_score(player, points)
         if player.score > 121:
             player.score = 121
-        self.notify_all(Notification(NotificationType.POINTS, player, points, reason))
+        self._notify(NotificationType.POINTS, player, points, reason)
+
+    # All score changes go through here, to keep track of the highest score
+    def _add_score (self, player : Player, points : int) -> None:
+        score = player.score + points
+        player.score = score
+        if score > self._max_score:
+            self._max_score = score
 
     # Start a new game; that means intros and cut for deal
     def start_game (self, initial_dealer : Player = None) -> None:
         # Reset the players scores for a new game
         self.players.reset()
+        self._max_score = 0
 
         # Notify everyone of a new game
-        self.notify_all (Notification (NotificationType.NEW_GAME, None, 0, str(self.players) + "\nYou must now cut for deal"))
-
-        # Create a deck and cut for deal
-        self.deck = Deck()
-        self.deck.shuffle()
+        self._notify(NotificationType.NEW_GAME, None, 0, f"{self.players}\nYou must now cut for deal")
 
         # Cut for deal unless explicit dealer was specified
+        # Each cut is a uniformly random card from the full deck, so no deck or shuffle is needed
         if initial_dealer is not None:
             self.initial_dealer = initial_dealer
             self.players.set_dealer(initial_dealer)
@@ -395,10 +546,10 @@ class Game:
             dealer = None
             lowestCutRank = 15
             for player in self.players:
-                card = self.deck.cut_a_card()
+                card = random.choice(_CARDS)
                 while card.rank == lowestCutRank:
-                    card = self.deck.cut_a_card()
-                self.notify_all (Notification (NotificationType.CUT_FOR_DEAL, player, 0, card))
+                    card = random.choice(_CARDS)
+                self._notify(NotificationType.CUT_FOR_DEAL, player, 0, card)
                 if card.rank < lowestCutRank:
                     lowestCutRank = card.rank
                     dealer = player
@@ -407,36 +558,35 @@ class Game:
 
     # Start a new round; deal, create crib, cut starter card 
     def start_round (self) -> None:
-        # Deal the cards
-        self.deck = Deck()
-        self.deck.shuffle()
-        for player in self.players:
-            player.hand = Hand()
-        for i in range (6):
-            for player in self.players:
-                player.hand.add_card(self.deck.draw())
-        for player in self.players:
-            player.hand.sort()
-        self.notify_all(Notification(NotificationType.DEAL, self.players.dealer, 0, self.players))
+        # Deal the cards; one random sample covers every hand plus the starter card (the last card)
+        num_players = len(self.players)
+        dealt = random.sample(_MASTER_DECK, 6 * num_players + 1)
+        # Players get a new Hand (and the dealer a new crib) each round, as the UX thread may still be reading the old one
+        dealer = self.players.dealer
+        for i, player in enumerate(self.players):
+            hand = Hand()
+            hand.add_cards([_CARDS[code] for code in dealt[i : 6 * num_players : num_players]])
+            hand.sort()
+            player.hand = hand
+        self._notify(NotificationType.DEAL, dealer, 0, self.players)
 
         # Set up the discard pile
-        self.discards = Discards()
+        self.discards.reset()
 
         # Create the crib by getting lay_away cards from each player
         crib = Hand()
         for player in self.players:
-            for card in player.select_lay_aways (player == self.players.dealer):
-                crib.add_card (card)
-        self.crib = crib
-        self.players.dealer.crib = crib
+            crib.add_cards (player.select_lay_aways (player == dealer))
+        self.crib = dealer.crib = crib
         assert len(crib) == 4, "Crib doesn't have 4 cards!"
         for player in self.players:
             assert len(player.hand) == 4, "Player " + player.name + " doesn't have 4 unplayed cards"
             assert len(player.hand.played_cards) == 0, "Player " + player.name + " doesn't have 0 played cards"
+        self._cards_left = 4 * len(self.players)
 
         # Draw the starter card
-        self.starter = self.deck.draw();
-        self.notify_all (Notification (NotificationType.STARTER_CARD, self.players.turn, 0, str(self.starter)))
+        self.starter = _CARDS[dealt[-1]]
+        self._notify(NotificationType.STARTER_CARD, self.players.turn, 0, str(self.starter))
         if self.starter.rank == 11:
             self.add_points(self.players.dealer, 2, "His Heels")
 
@@ -444,24 +594,27 @@ class Game:
     # Let the current player take their turn
     def take_turn(self) -> None:
         player = self.players.turn
+        hand = player.hand
+        discards = self.discards
+        discard_sum = discards.sum
 
         # If the player has no cards left to play, then skip their turn
-        if len(player.hand) == 0:
+        if len(hand) == 0:
             return
 
         # If they can play, let the player play. Keep track of last_to_peg for last card
-        if self.discards.sum + player.hand[0].points <= 31:
-            num_cards_to_play = len(player.hand)
-            discard_sum = self.discards.sum
+        if discard_sum + hand.min_points <= 31:
+            num_cards_to_play = len(hand)
             num_opp_cards = len(self.players[0].hand) if player == self.players[0] else len(self.players[1].hand)
-            card = player.select_play(self.starter, self.discards, num_opp_cards)
-            assert len(player.hand) == num_cards_to_play - 1, "Player didn't play a card!"
-            assert discard_sum != self.discards.sum, "Player didn't put their play card on the discard pile!"
+            card = player.select_play(self.starter, discards, num_opp_cards)
+            assert len(hand) == num_cards_to_play - 1, "Player didn't play a card!"
+            assert discard_sum != discards.sum, "Player didn't put their play card on the discard pile!"
+            self._cards_left -= 1
             self.last_to_peg = player
-            self.notify_all(Notification(NotificationType.PLAY, self.players.turn, 0, str(card)))
+            self._notify(NotificationType.PLAY, player, 0, str(card))
             self.score_pegging_points()
-            if self.discards.sum == 31:
-                self.discards.start_new_pile()
+            if discards.sum == 31:
+                discards.start_new_pile()
                 return
             if self.round_over:
                 self.add_points(self.last_to_peg, 1, "Last card")
@@ -469,7 +622,7 @@ class Game:
         
         # Else they have cards, but can't play.
         # Notify with a "go"
-        self.notify_all(Notification(NotificationType.GO, player, 0, "Go"))
+        self._notify(NotificationType.GO, player, 0, "Go")
 
         # If no one else can go, reset the discard pile and give the last pegger credit for last card
         if not self.can_anyone_go:
@@ -482,114 +635,93 @@ class Game:
     def score_pegging_points(self) -> None:
         player = self.players.turn
         discards = self.discards
-        card = discards[len(discards) - 1]
-        reason = ""
-        points = 0
+        pile_sum = discards.sum
+        points, in_a_row, run_len = peg_score(discards._ranks, pile_sum)
+        if points == 0:
+            return
 
-        if discards.sum == 31:
+        reason = ""
+        if pile_sum == 31:
             reason += "31 for 2\n"
-            points += 2
-
-        if discards.sum == 15:
+        elif pile_sum == 15:
             reason += "Fifteen for 2\n"
-            points += 2
+        if in_a_row == 2:
+            reason += "Pair for 2\n"
+        elif in_a_row == 3:
+            reason += "Three of a kind for 6\n"
+        elif in_a_row == 4:
+            reason += "Four of a kind for 12\n"
+        if run_len > 0:
+            reason += f"Run of {run_len}"
 
-        in_a_row = 1           # How many cards in a row of the same rank?
-        i = len(discards) - 2
-        while i >= 0:
-            if discards[i].rank == card.rank:
-                in_a_row += 1
-            else:
-                break
-            i -= 1
-        if in_a_row > 1:
-            points += 2 * comb(in_a_row, 2)
-            if in_a_row == 2:
-                reason += "Pair for 2\n"
-            elif in_a_row == 3:
-                reason += "Three of a kind for 6\n"
-            elif in_a_row == 4:
-                reason += "Four of a kind for 12\n"
-
-        if len(discards) >= 3:
-            for i in range (len(discards) - 2):
-                check_for_run = []
-                for j in range (i, len(discards)):
-                    check_for_run.append(discards[j].rank)
-                check_for_run.sort()
-                is_run = True
-                last_card = check_for_run[0]
-                for k in range(1, len(check_for_run)):
-                    if check_for_run[k] != last_card + 1:
-                        is_run = False
-                        break
-                    last_card = check_for_run[k]
-                if is_run:
-                    run_size = len(check_for_run)
-                    reason += "Run of " + str(run_size)
-                    points += run_size
-                    break
-        
-        if points > 0:
-            self.add_points(player, points, reason)
+        self.add_points(player, points, reason)
     
     def score_hands(self) -> None:
-        self.notify_all(Notification(NotificationType.ROUND_OVER, None, 0, str(self.starter)))
+        self._notify(NotificationType.ROUND_OVER, None, 0, str(self.starter))
         starter = self.starter
         player = self.players.dealer
         for i in range (len(self.players)):
             if not self.game_over:
                 player = self.players.next_player(player)
-                cards = player.hand.played_cards
-                cards.sort()
-                score, reason = Game.get_hand_value(cards, starter)
-                player.score += score
-                self.notify_all(Notification(NotificationType.SCORE_HAND, player, score, reason))
+                score, reason = Game.get_hand_value(player.hand.played_cards, starter)
+                self._add_score(player, score)
+                self._notify(NotificationType.SCORE_HAND, player, score, reason)
 
         if not self.game_over:
             assert player == self.players.dealer, "Player should be dealer when scoring the crib"
-            self.crib._cards.sort()
+            self.crib._cards.sort()     # Not needed for scoring, but the crib is shown to the players in this order
             score, reason = Game.get_hand_value(self.crib._cards, starter, is_crib = True)
-            player.score += score
-            self.notify_all(Notification(NotificationType.SCORE_CRIB, player, score, reason))
+            self._add_score(player, score)
+            self._notify(NotificationType.SCORE_CRIB, player, score, reason)
 
     # Get the value of a hand (4 cards + starter card)
     # Returns a tuple of score, text describing the score components
     def get_hand_value(cards : List[Card], starter : Card, is_crib : bool = False) -> Tuple[int, str]:
+        # One pass over the cards collects everything that depends on them:
+        # - Knobs: the jack of the starter's suit
+        # - Flush: OR together one bit per suit; if only one bit is set, the cards are all the same suit
+        # - For pairs, runs and 15s, we don't care about the suit or the order of the cards, only how many there are
+        #   of each rank. So pack those counts into a key (4 bits per rank)
+        starter_suit = starter._suit
+        num_knobs = 0
+        suits = 0
+        key = 1 << (4 * starter._rank)
+        for card in cards:
+            rank = card._rank
+            suit = card._suit
+            if rank == 11 and suit == starter_suit:
+                num_knobs += 1
+            suits |= 1 << suit
+            key += 1 << (4 * rank)
+
+        flush_points = 0
+        starter_bit = 1 << starter_suit
+        if suits & (suits - 1) == 0 and (not is_crib or suits == starter_bit):
+            flush_points = 5 if suits == starter_bit else 4
+
+        # Everything else only depends on these, so the score and reason are cached
+        return Game.get_scored_hand(key, num_knobs, flush_points)
+
+    # Get the score and reason for a hand, given its rank count key (see get_hand_value) and the suit dependent points
+    # There are only a few thousand distinct combinations, and a long run of games scores the same ones over and over
+    @lru_cache(maxsize=None)
+    def get_scored_hand(key : int, num_knobs : int, flush_points : int) -> Tuple[int, str]:
         score = 0       # Computed score
         reason = ""     # Computed reason for the score (e.g, fifteen 4, knobs for 1, etc)
 
         # Knobs
-        for card in cards:
-            if card.rank == 11 and card.suit == starter.suit:
-                score += 1
-                reason += "Knobs for 1\n"
-        
+        for i in range(num_knobs):
+            score += 1
+            reason += "Knobs for 1\n"
+
         # Flush
-        is_flush = True
-        first_card = cards[0]
-        for card in cards:
-            if card.suit != first_card.suit:
-                is_flush = False
-                break
-        if is_crib and cards[0].suit != starter.suit:
-            is_flush = False
-        if is_flush:
-            flush_points = 5 if cards[0].suit == starter.suit else 4
+        if flush_points > 0:
             score += flush_points
-            reason += "A flush for " + str (score) + "\n"
-
-        # For pairs, runs and 15s, we don't care about the suit, so convert cards to just an array of int values
-        # For pairs and runs, we need the rank
-        # For 15s, we need the point values
-        tmp = cards
-        cards = [starter.rank]
-        for card in tmp:
-            cards.append(card.rank)
-        cards.sort()
+            reason += f"A flush for {flush_points}\n"
+
+        num_pairs, run_len, multiplier, num_15s = Game.get_rank_scores(key)
 
         # Pairs
-        num_pairs = Game.get_pair_count(cards)
         if num_pairs > 0:
             pair_points = 2*num_pairs
             score += pair_points
@@ -605,137 +737,65 @@ class Game:
                 reason += "Four of a kind for "
             else:
                 assert False, "It's not possible to score " + str(num_pairs) + " pairs"
-            reason += str (pair_points) + "\n"
+            reason += f"{pair_points}\n"
 
         # Runs
-        run_len, multiplier = Game.get_run_count (cards)
         if run_len > 0:
             score += run_len * multiplier
             if multiplier == 1:
                 reason += "A run of "
             else:
-                reason += str(multiplier) + " runs of "
-            reason += str(run_len) + " for " + str (run_len * multiplier) + "\n"
+                reason += f"{multiplier} runs of "
+            reason += f"{run_len} for {run_len * multiplier}\n"
 
         # 15s
-        num_15s = Game.get_counts (15, cards)
         if num_15s > 0:
             score += num_15s*2
             if num_15s == 1:
                 reason += "Fifteen for 2\n"
             else:
-                reason += str(num_15s) + " fifteens for " + str (num_15s*2) + "\n"
+                reason += f"{num_15s} fifteens for {num_15s*2}\n"
 
         return score, reason
 
-    # Get the number of pair points in a sorted hand
-    def get_pair_count (cards : List[int]) -> int:
+    # Get the number of pairs, the run length and multiplier, and the number of 15s for a set of ranks
+    # The ranks are given as a key holding the number of cards of each rank in 4 bits per rank
+    def get_rank_scores (key : int) -> Tuple[int, int, int, int]:
+        counts = [(key >> (4 * rank)) & 15 for rank in range(15)]
+        ranks = [rank for rank in range(1, 14) for i in range(counts[rank])]
+        run_len, multiplier = Game.get_run_count(counts)
+        return Game.get_pair_count(counts), run_len, multiplier, count_fifteens(ranks)
+
+    # Get the number of pairs, given the rank counts (n cards of the same rank make n*(n-1)/2 pairs)
+    def get_pair_count (counts : List[int]) -> int:
         num_pairs = 0
-        for i in range (len(cards) - 1):
-            j = i + 1
-            while j < len(cards):
-                if cards[i] == cards[j]:
-                    num_pairs += 1
-                    j += 1
-                else:
-                    break
+        for n in counts:
+            num_pairs += n * (n - 1) // 2
         return num_pairs
 
-    # Get the number of run points in a sorted hand
-    def get_run_count (cards : List[int]) -> Tuple[int, int]: 
-        # Check for runs starting at card i in a sorted list
-        i = 0
-        while i < len(cards):
-            run_len = 1
-            multiplier = 1          # Can be 1, 2, 3, or 4 - depending on pairings in the list
-            paired_card = 0         # First paired card detected (used to compute multiplier)
-
-            first_card = cards[i]
-            last_card = first_card
-            j = i + 1
-            while j < len(cards):
-                if cards[j] > last_card + 1:    # No run starting at index 1, so break
-                    break
-                elif cards[j] == last_card + 1: # Might be a run, need to check the next card
-                    last_card = cards[j]
-                    run_len += 1
-                else:                           # Pairs used to calculate multiplier
-                    assert cards[j] == last_card, "The cards are supposed to be sorted"
-                    if paired_card == 0:        # One pair means multiplier = 2
-                        multiplier = 2
-                        paired_card = last_card
-                    elif paired_card == last_card: # Three of a kind means multiplier = 3
-                        multiplier = 3
-                    else:
-                        multiplier = 4          # Two separate pairs means multiplier = 4
-                j += 1
-            
-            if run_len >= 3:
+    # Get the run length and multiplier, given the rank counts
+    # A run is a span of 3 or more consecutive ranks; the multiplier is the number of ways to pick one card of each rank
+    def get_run_count (counts : List[int]) -> Tuple[int, int]:
+        run_len = 0
+        multiplier = 1
+        for rank in range(1, 15):
+            n = counts[rank]
+            if n > 0:
+                run_len += 1
+                multiplier *= n
+            elif run_len >= 3:
                 return run_len, multiplier
-            i = j
+            else:
+                run_len = 0
+                multiplier = 1
         return 0, 0
 
-    # Get the number of ways to make "count" points out of the sorted list "cards"
-    def get_counts (count : int, cards : List[int]) -> int:
-        num_ways = 0
-        for i in range(len(cards)):
-            card = cards[i] if cards[i] < 10 else 10
-            if card > count:
-                return num_ways
-            if card == count:
-                num_ways += 1
-                continue
-            if i == len(cards) - 1:
-                continue
-            cards_after = []
-            for j in range (i+1, len(cards)):
-                cards_after.append(cards[j])
-            num_ways += Game.get_counts (count - card, cards_after)
-        return num_ways
-    
     # Calculate the pegging points that would be scored placing a given card on the discard pile
     def calculate_pegging_points (card_rank : int, discards : Discards) -> int:
-        points = 0
-
-        card_points = card_rank if card_rank < 10 else 10
-
-        if discards.sum + card_points == 31:
-            points += 2
-
-        if discards.sum + card_points == 15:
-            points += 2
-
-        in_a_row = 1           # Check for pairs (# cards in a row of the same rank)
-        i = len(discards) - 1
-        while i >= 0:
-            if discards[i].rank == card_rank:
-                in_a_row += 1
-            else:
-                break
-            i -= 1
-        if in_a_row > 1:
-            points += 2 * comb(in_a_row, 2)
-
-        if len(discards) >= 2:
-            run_points = 0
-            for i in range (len(discards) - 1):
-                check_for_run = [card_rank]
-                for j in range (i, len(discards)):
-                    check_for_run.append(discards[j].rank)
-                check_for_run.sort()
-                is_run = True
-                last_card = check_for_run[0]
-                for k in range(1, len(check_for_run)):
-                    if check_for_run[k] != last_card + 1:
-                        is_run = False
-                        break
-                    last_card = check_for_run[k]
-                if is_run:
-                    run_points = len(check_for_run)
-                    break
-        
-            points += run_points
-
+        ranks = discards._ranks
+        ranks.append(card_rank)         # Temporarily put the card on the pile
+        points = peg_score(ranks, discards.sum + (card_rank if card_rank < 10 else 10))[0]
+        ranks.pop()
         return points
 
     # The main loop to play a game
@@ -753,13 +813,12 @@ class Game:
             self.players.rotate_dealer()    # Rotate dealer after each round
 
         winner = None
-        final_score = ""
         for player in self.players:
             if player.score >= 121:
                 winner = player
                 player.score = 121
-            final_score += player.name + " " + str(player.score) + "\t\t"
-        self.notify_all (Notification (NotificationType.GAME_OVER, winner, 0, final_score))
+        final_score = "".join(f"{player.name} {player.score}\t\t" for player in self.players)
+        self._notify(NotificationType.GAME_OVER, winner, 0, final_score)
 
 
 """
@@ -769,16 +828,19 @@ Always discards it's highest cards to the crib
 Always plays it's lowest card while pegging
 """
 class BeginerPlayer(Player):
+    __slots__ = ()
+    wants_notifications = False
+
     def __init__(self):
         super().__init__()
         self.name = "Beginer"
 
     def select_lay_aways(self, my_crib : bool) -> Tuple[Card, Card]:
-        return self.hand.play_card(str(self.hand[5]), True), self.hand.play_card(str(self.hand[4]), True)
+        return self.hand.play_card(self.hand[5], True), self.hand.play_card(self.hand[4], True)
 
     def select_play(self, starter, discards, num_opp_cards) -> Card:
         hand = self.hand
-        card = hand.play_card(str(hand[0]))
+        card = hand.play_card(hand[0])
         discards.add_card(card)
         return card
 
@@ -792,6 +854,9 @@ Discards to the crib keeping the cards with the highest net points (card points
 Plays the pegging card that will score the highest. If a tie, play the highest allowed card
 """
 class IntermediatePlayer(Player):
+    __slots__ = ()
+    wants_notifications = False
+
     def __init__(self):
         super().__init__()
         self.name = "Intermediate"
@@ -809,20 +874,8 @@ class IntermediatePlayer(Player):
         if len(hand) == 4 and hand[0].suit == hand[1].suit == hand[2].suit == hand[3].suit:
             points += 4.18   # 4 points for the flush, plus 18% chance the starter card is the same suit
 
-        # For 15s, pairs, runs - first convert to simpler list of ranks
-        cards = []
-        for card in hand:
-            cards.append(card.rank)
-
-        # 15s
-        points += 2 * Game.get_counts (15, cards)
-
-        # pairs
-        points += 2 * Game.get_pair_count(cards)
-
-        # runs
-        run_len, multiplier = Game.get_run_count (cards)
-        points += run_len * multiplier
+        # 15s, pairs, runs
+        points += score_ranks([card.rank for card in hand])
 
         return points
 
@@ -843,8 +896,6 @@ class IntermediatePlayer(Player):
                 crib.add_card(cardj)
                 hand_value = IntermediatePlayer.expected_hand_value (hand)
                 crib_value = IntermediatePlayer.expected_hand_value (crib)
-                h = str(hand)
-                c = str(crib)
                 if my_crib:
                     points = hand_value + crib_value
                 else:
@@ -868,24 +919,27 @@ class IntermediatePlayer(Player):
     # Select discards resulting in the highest net points (card points +/- discard points)
     def select_lay_aways(self, my_crib : bool) -> Tuple[Card, Card]:
         card1, card2 = IntermediatePlayer.find_lay_aways (self.hand, my_crib)
-        return self.hand.play_card(str(card1), True), self.hand.play_card(str(card2), True)
+        return self.hand.play_card(card1, True), self.hand.play_card(card2, True)
 
     # Do the pegging play that gives the highest score. If a tie, play the highest allowed card
     def select_play(self, starter : Card, discards : Discards, num_opp_cards : int) -> Card:
         hand = self.hand
-        points_per_card = [-1]*len(hand)
+        points_per_card = [-1]*len(hand)    # -1 for cards that can't be played
         max_points = 0
+
+        pile_sum = discards.sum
         for i in range(len(hand) - 1, -1, -1):
-            if discards.sum + hand[i].points > 31:
-                points_per_card[i] = -1
+            card = hand[i]
+            if pile_sum + card._points > 31:
                 continue
-            points_per_card[i] = Game.calculate_pegging_points(hand[i].rank, discards)
-            if points_per_card[i] > max_points:
-                max_points = points_per_card[i]
+            points = Game.calculate_pegging_points(card._rank, discards)
+            points_per_card[i] = points
+            if points > max_points:
+                max_points = points
 
         for i in range(len(hand) - 1, -1, -1):
             if points_per_card[i] == max_points:
-                card = hand.play_card(str(hand[i]))
+                card = hand.play_card(hand[i])
                 discards.add_card(card)
                 return card
         assert False, "Couldn't select a card to play"
@@ -902,34 +956,37 @@ that result in highest net points (hand points +/- crib points) based on probabi
 Pegging is done based on highest value of computer pegging points - expected player counter-pegging points,
 where expected value assumes (naively) that player cards are random among unseen cards
 """
-from bisect import bisect_left
+from bisect import insort
+
 class AdvancedPlayer(Player):
+    __slots__ = ()
+    wants_notifications = False
+
     def __init__(self):
         super().__init__()
         self.name = "Advanced"
 
     # Compute the expected value of splitting a deal into hand and crib cards
     # The algo uses a weighted probability of the starter card draw (but doesn't consider oppont crib cards)
-    def expected_value (hand : Hand, crib : Hand, my_crib : bool) -> int:
+    # num_suits (the number of unseen cards of each suit) is the same for every split of a deal, so callers that
+    # evaluate all the splits can compute it once and pass it in
+    def expected_value (hand : Hand, crib : Hand, my_crib : bool, num_suits : List[int] = None) -> int:
         points = 0
         crib_points = 0
     
         # First compute knobs/flush values, which depend on the card suits. To do that we need variables that
         # let us compute probability that starter card is of a given suit
-        num_cards = 52
-        num_suits = {Suit.CLUBS : 13, Suit.DIAMODS : 13, Suit.HEARTS : 13, Suit.SPADES : 13}
-        for card in hand:
-            num_cards -= 1
-            num_suits[card.suit] -= 1
-        for card in crib:
-            num_cards -= 1
-            num_suits[card.suit] -= 1
-
-        # Flush points
-        if hand[0].suit == hand[1].suit == hand[2].suit == hand[3].suit:
+        hand_mask = cards_mask(hand)
+        crib_mask = cards_mask(crib)
+        num_cards = 52 - len(hand) - len(crib)
+        if num_suits is None:
+            num_suits = AdvancedPlayer.unseen_suit_counts(hand_mask | crib_mask)
+
+        # Flush points (all the cards are within the mask of the first card's suit)
+        if hand_mask & ~_SUIT_MASKS[hand[0].suit] == 0:
             points += 4                                         # Flush
             points += (13 - num_suits[hand[0].suit])/num_cards  # Plus probability 5-card flush
-        if crib[0].suit == crib[1].suit:
+        if crib_mask & ~_SUIT_MASKS[crib[0].suit] == 0:
             n = 13 - num_suits[crib[0].suit]
             crib_points += n/num_cards * (n-1)/(num_cards-1) + (n-2)/(num_cards-2)        
 
@@ -952,50 +1009,61 @@ class AdvancedPlayer(Player):
         for card in crib:
             crib_cards.append(card.rank)
 
-        # Next, create variables to compute the starter will be of a given rank
+        # Finally, add the weighted points for each possible starter draw; these only depend on the ranks (and the
+        # number of unseen cards), so are cached. The ranks are sorted so each hand and crib has a single cache key
+        starter_values = AdvancedPlayer.starter_weighted_values(tuple(sorted(cards)), tuple(sorted(crib_cards)), num_cards)
+        points += starter_values[0]
+        crib_points += starter_values[1]
+
+        if my_crib:
+            return points + crib_points
+        else:
+            return points - crib_points
+
+    # The non-suited value of a hand and crib discard (sorted tuples of ranks), weighted by the probability of each
+    # starter card rank. Returns a tuple of the hand points and crib points
+    # It's small (at most ~165k entries), so the cache is kept across games
+    @lru_cache(maxsize=None)
+    def starter_weighted_values (cards : Tuple[int], crib_cards : Tuple[int], num_cards : int) -> Tuple[float, float]:
+        points = 0
+        crib_points = 0
+
+        # Variables to compute the probability the starter will be of a given rank
         num_ranks = [4]*14
         num_ranks[0] = 0
-        for card in hand:
-            num_ranks[card.rank] -= 1
+        for rank in cards:
+            num_ranks[rank] -= 1
 
-        # Finally, let's compute the weighted points for each possible starter draw
+        # The hand and crib values for every starter rank come from a cache, so this is just the weighted sum
+        hand_values = AdvancedPlayer.starter_values(cards)
+        crib_values = AdvancedPlayer.starter_values(crib_cards)
         for starter_rank in range (1, 14):
             prob = num_ranks[starter_rank]/num_cards
+            points += prob * hand_values[starter_rank]
+            crib_points += prob * crib_values[starter_rank]
 
-            starter_card_ix = bisect_left(cards, starter_rank)
-            cards.insert(starter_card_ix, starter_rank)
-            points += prob * AdvancedPlayer.non_suited_value(cards)
-            cards.pop(starter_card_ix)
-            assert len(cards) == 4, "Hand length <> 4"
-            assert cards[0] <= cards[1] <= cards[2] <= cards[3], "Cards no longer sorted"
-
-            starter_card_ix = bisect_left(crib_cards, starter_rank)
-            crib_cards.insert(starter_card_ix, starter_rank)
-            crib_points += prob * AdvancedPlayer.non_suited_value(crib_cards)
-            crib_cards.pop(starter_card_ix)
-            assert len(crib_cards) == 2, "Crib discard length <> 2"
-            assert crib_cards[0] <= crib_cards[1], "Crib cards no longer sorted"
+        return points, crib_points
 
-        if my_crib:
-            return points + crib_points
-        else:
-            return points - crib_points
+    # The non-suited value of a sorted tuple of ranks with each possible starter rank added (index 1..13)
+    # These don't depend on anything else, and there are only 1820 distinct 4 card hands (rank multisets) and 91 crib
+    # discards, so they are cached rather than recomputed for each unseen card count and hand/crib pairing
+    @lru_cache(maxsize=None)
+    def starter_values (cards : Tuple[int]) -> Tuple[int]:
+        values = [0]*14
+        for starter_rank in range (1, 14):
+            with_starter = list(cards)
+            insort(with_starter, starter_rank)
+            values[starter_rank] = AdvancedPlayer.non_suited_value(with_starter)
+        return tuple(values)
 
     # non-suited value of a set of cards (cards = order list of ranks)
+    # The ranks are already sorted, so skip score_ranks() and go straight to the cached kernel
     def non_suited_value (cards : List[int]) -> int:
-        points = 0
-    
-        # 15s
-        points += 2 * Game.get_counts (15, cards)
+        return _score_sorted_ranks(tuple(cards))
 
-        # pairs
-        points += 2 * Game.get_pair_count(cards)
-
-        # runs
-        run_len, multiplier = Game.get_run_count (cards)
-        points += run_len * multiplier
-
-        return points
+    # The number of unseen cards of each suit, given a mask of the seen cards
+    def unseen_suit_counts (seen_mask : int) -> List[int]:
+        return [13 - bin(seen_mask & suit_mask).count("1") for suit_mask in _SUIT_MASKS]
 
     # Find which cards are the best crib lay-aways (card points +/- discard points)
     def find_lay_aways(hand : Hand, my_crib : bool) -> Tuple[Card, Card, int]:
@@ -1003,6 +1071,7 @@ class AdvancedPlayer(Player):
         max_points = 0
         card1 = None
         card2 = None
+        num_suits = AdvancedPlayer.unseen_suit_counts(cards_mask(hand))   # Same for every split of the deal
 
         # Find the discards that produces the highest score (hand +- crib) without regard to starter draw
         for i in range(len(hand) - 1):
@@ -1011,9 +1080,7 @@ class AdvancedPlayer(Player):
                 cardi = hand.pop(i)
                 crib.add_card(cardi)
                 crib.add_card(cardj)
-                points = AdvancedPlayer.expected_value(hand, crib, my_crib)
-                h = str(hand)
-                c = str(crib)
+                points = AdvancedPlayer.expected_value(hand, crib, my_crib, num_suits)
                 if points >= max_points:
                     card1 = cardi
                     card2 = cardj
@@ -1028,7 +1095,7 @@ class AdvancedPlayer(Player):
     # Select discards resulting in the highest net points (card points +/- discard points)
     def select_lay_aways(self, my_crib : bool) -> Tuple[Card, Card]:
         card1, card2, value = AdvancedPlayer.find_lay_aways(self.hand, my_crib)
-        return self.hand.play_card(str(card1), True), self.hand.play_card(str(card2), True)
+        return self.hand.play_card(card1, True), self.hand.play_card(card2, True)
 
     # Find the pegging play that gives the highest score. If a tie, select the highest allowed card
     # We'll evaluate immediate pegging points gained - probability of a maximal counter-peg
@@ -1057,20 +1124,23 @@ class AdvancedPlayer(Player):
         # OK - at this point, the probability of opponent having card with rank r is approximately:
         #   num_opp_cards * num_ranks[r]/num_remaining_cards
 
+        pile_sum = discards.sum
         for i in range(len(hand) - 1, -1, -1):
-            if discards.sum + hand[i].points > 31:
+            card = hand[i]
+            card_sum = pile_sum + card._points
+            if card_sum > 31:
                 continue
-            peg_points = Game.calculate_pegging_points(hand[i].rank, discards)
+            peg_points = Game.calculate_pegging_points(card._rank, discards)
             counter_peg_points = 0
-            points_left = 31 - discards.sum - hand[i].points    # How many points are left for counter-pegging?
+            points_left = 31 - card_sum                     # How many points are left for counter-pegging?
             if num_opp_cards > 0 and points_left > 0:
-                discards.add_card (Card(Suit.SPADES, hand[i].rank)) # Temporarily add card to discards pile
+                discards.add_card (card)                    # Temporarily add card to discards pile
                 max_rank = 13 if points_left >= 10 else points_left
                 for r in range(1, max_rank + 1):
                     p = Game.calculate_pegging_points(r, discards)
                     #counter_peg_points += p * num_opp_cards * (num_ranks[r]/num_remaining_cards) / 2
                     counter_peg_points += p * num_ranks[r]/num_remaining_cards
-                discards.pop()                                      # Pop card off discard pile
+                discards.pop()                              # Pop card off discard pile
             points_per_card[i] = peg_points - counter_peg_points
             if points_per_card[i] > max_points:
                 max_points = points_per_card[i]
@@ -1106,7 +1176,7 @@ def get_player(level : int) -> Player:
 
 # A utility method to let two AIs battle each other
 def play_match(player0 : Player, player1 : Player, num_games : int) -> None:
-    print ("A match to " + str(num_games) + " between " + player0.name + " and " + player1.name)
+    print (f"A match to {num_games} between {player0.name} and {player1.name}")
     player0_wins = 0
     player1_wins = 0
     start_time = time()
@@ -1122,8 +1192,8 @@ def play_match(player0 : Player, player1 : Player, num_games : int) -> None:
             player1_wins += wins
 
     total_time = (time() - start_time)
-    print ("Final score: " + player0.name + " " + str(player0_wins) + "\t\t" + player1.name + " " + str(player1_wins))
-    print ("The match took " + str(total_time) + " seconds (" + str(total_time/num_games) + " seconds/game)")
+    print (f"Final score: {player0.name} {player0_wins}\t\t{player1.name} {player1_wins}")
+    print (f"The match took {total_time} seconds ({total_time/num_games} seconds/game)")
 
 # Here's how to see the effectiveness of one AI against another
 #play_match (AdvancedPlayer(), IntermediatePlayer(), 100)
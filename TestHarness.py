@@ -12,12 +12,14 @@ def trace (s):
 def verify_classes():
     # Verified an unshuffled deck starts with a 2 of clubs and has 52 cards
     deck = CribbageEngine.Deck()
+    assert len(deck) == 52, "A new deck should have 52 cards"
     card = deck.draw()
     assert card.suit == CribbageEngine.Suit.CLUBS, "Unshuffled deck doesn't start wtih ace of clubs"
     assert card.rank == 1, "Unshuffled deck doesn't start wtih ace of clubs"
     for i in range(1, 52):
         card = deck.draw()
         assert type(card) is CribbageEngine.Card, "Deck should have 52 cards"
+    assert len(deck) == 0, "Drawing all 52 cards should empty the deck"
 
     # Verify we can shuffle a deck, and deal a cribbage hand from 6 drawn cards
     deck = CribbageEngine.Deck()
@@ -63,6 +65,33 @@ def verify_classes():
     discards.start_new_pile()
     assert len(discards.older_discards) == 5, "Discards.start_new_pile() should append to older_discards"
 
+    # Verify the rank-only scoring (15s, pairs, runs) used by the AIs
+    assert CribbageEngine.score_ranks([5, 5, 5, 5, 11]) == 28, "Four 5s and a jack should score 28 without knobs"
+    assert CribbageEngine.score_ranks([3, 4, 4, 5, 5]) == 16, "A double double run of 3 should score 16"
+    assert CribbageEngine.score_ranks([1, 2, 3, 4, 5]) == 7, "A run of 5 with one fifteen should score 7"
+
+    # Verify pegging scores (points, cards of the same rank in a row, run length) for the last card played
+    assert CribbageEngine.peg_score([3, 5, 4], 12) == (3, 1, 3), "An out of order run of 3 should peg 3"
+    assert CribbageEngine.peg_score([2, 3, 4, 4], 13) == (2, 2, 0), "A pair should break the run"
+    assert CribbageEngine.peg_score([1, 2, 3, 5, 4], 15) == (7, 1, 5), "A run of 5 on 15 should peg 7"
+    assert CribbageEngine.peg_score([5, 6, 7, 5], 23) == (3, 1, 3), "A run of 3 should be found before the repeated rank"
+
+    # Verify hand scoring of knobs and flushes (a crib flush must include the starter)
+    clubs = [CribbageEngine.Card(CribbageEngine.Suit.CLUBS, rank) for rank in [2, 4, 6, 11]]
+    score, reason = CribbageEngine.Game.get_hand_value(clubs, CribbageEngine.Card(CribbageEngine.Suit.CLUBS, 9))
+    assert score == 10 and "Knobs for 1\nA flush for 5\n" in reason, "Knobs, a 5 card flush and 2 fifteens should score 10"
+    score, reason = CribbageEngine.Game.get_hand_value(clubs, CribbageEngine.Card(CribbageEngine.Suit.HEARTS, 9), True)
+    assert score == 4 and "flush" not in reason, "A crib flush needs the starter to match"
+
+    # Verify the AI's expected value of a lay-away doesn't depend on the order of the cards
+    hand = CribbageEngine.Hand()
+    hand.add_cards([CribbageEngine.Card(CribbageEngine.Suit.HEARTS, rank) for rank in [2, 5, 7, 12]])
+    pair = [CribbageEngine.Card(CribbageEngine.Suit.SPADES, 2), CribbageEngine.Card(CribbageEngine.Suit.CLUBS, 2)]
+    crib = [CribbageEngine.Card(CribbageEngine.Suit.SPADES, 3), CribbageEngine.Card(CribbageEngine.Suit.CLUBS, 1)]
+    CribbageEngine.AdvancedPlayer.expected_value(hand, pair, True)
+    value = CribbageEngine.AdvancedPlayer.expected_value(hand, crib, True)
+    assert value == CribbageEngine.AdvancedPlayer.expected_value(hand, [crib[1], crib[0]], True), "Expected value depends on crib order"
+
     # Verify we can play a match between various AIs
     matches = [[CribbageEngine.BeginerPlayer(), CribbageEngine.BeginerPlayer()], \
         [CribbageEngine.IntermediatePlayer(), CribbageEngine.IntermediatePlayer()], \